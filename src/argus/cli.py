@@ -4,7 +4,6 @@ import re
 import time
 import shutil
 import subprocess
-from datetime import datetime
 from typing import Optional, Dict
 
 import typer
@@ -99,6 +98,23 @@ def _service_info() -> Optional[Dict[str, str]]:
     return info
 
 
+def _state_from_info(info: Dict[str, str]) -> str:
+    active = (info.get("ActiveState") or "unknown").lower()
+    if active == "active":
+        return "RUNNING"
+    if active in ("activating",):
+        return "STARTING"
+    if active in ("deactivating",):
+        return "STOPPING"
+    return "STOPPED"
+
+
+def run_state() -> str:
+    """Monitor state as shown by `argus status`, without spawning the CLI (used by the TUI)."""
+    info = _service_info()
+    return _state_from_info(info) if info else get_state()
+
+
 def _ensure_user_unit_installed(log_path: str = "/var/log/auth.log", force: bool = False) -> None:
     """
     Make sure ~/.config/systemd/user/argus.service exists and is pipx-friendly.
@@ -143,15 +159,7 @@ def status():
         active = (info.get("ActiveState") or "unknown").lower()
         sub = (info.get("SubState") or "unknown").lower()
         enabled = (info.get("UnitFileState") or "unknown").lower()
-
-        if active == "active":
-            state = "RUNNING"
-        elif active in ("activating",):
-            state = "STARTING"
-        elif active in ("deactivating",):
-            state = "STOPPING"
-        else:
-            state = "STOPPED"
+        state = _state_from_info(info)
 
         typer.echo(f"STATE: {state}")
         typer.echo(f"SERVICE: {active}/{sub}  enabled={enabled}")
@@ -414,7 +422,7 @@ def events(
         raise typer.Exit()
 
     for e in rows:
-        ts = datetime.fromtimestamp(int(e["ts"])).strftime("%H:%M:%S")
+        ts = time.strftime("%H:%M:%S", time.localtime(int(e["ts"])))
         sev = (e.get("severity") or "").upper()
         code = (e.get("code") or "")
         msg = (e.get("message") or "").strip()
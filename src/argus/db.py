@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import sqlite3
 import time
 from typing import Optional, Tuple, List, Dict, Any
@@ -22,12 +23,27 @@ def connect() -> sqlite3.Connection:
     conn = sqlite3.connect(paths.db_file())
     conn.row_factory = sqlite3.Row
     conn.execute("PRAGMA busy_timeout=2000;")
+    # in WAL (vedi init_db) NORMAL resta consistente: si rinuncia solo al fsync per commit
+    conn.execute("PRAGMA synchronous=NORMAL;")
+    conn.execute("PRAGMA temp_store=MEMORY;")
     return conn
 
 
+# Path del DB già inizializzato da questo processo (evita DDL ad ogni chiamata).
+_schema_ready: Optional[str] = None
+
+
 def init_db() -> None:
-    """Crea tabelle v1 se non esistono."""
+    """Crea tabelle v1 se non esistono (una sola volta per processo)."""
+    global _schema_ready
+    db_path = str(paths.db_file())
+    if _schema_ready == db_path and os.path.exists(db_path):
+        return
+
     with connect() as conn:
+        # WAL è persistente nel file: TUI (lettore 1 Hz) e monitor (scrittore) non si bloccano a vicenda
+        conn.execute("PRAGMA journal_mode=WAL;")
+
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS runtime_flags (
@@ -56,6 +72,9 @@ def init_db() -> None:
             """
         )
 
+        # count_codes_since: range su code + filtro ts, tutto dentro l'indice
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_events_code_ts ON events(code, ts)")
+
         conn.execute(
             """
             CREATE TABLE IF NOT EXISTS first_seen (
@@ -69,6 +88,8 @@ def init_db() -> None:
 
         conn.commit()
 
+    _schema_ready = db_path
+
 
 # -------------------------
 # Runtime flags (state/mute/maintenance)
@@ -210,6 +231,42 @@ def list_events(limit: int = 10) -> List[Dict[str, Any]]:
         return [dict(r) for r in rows]
 
 
+def list_events_since(min_id: int, limit: int = 500) -> List[Dict[str, Any]]:
+    """Eventi con id > min_id (più recenti prima): letture incrementali per la TUI."""
+    init_db()
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT id, ts, code, severity, message, entity, details_json,
+                   report_md_path, report_json_path, is_active, ended_ts
+            FROM events
+            WHERE id > ?
+            ORDER BY id DESC
+            LIMIT ?
+            """,
+            (min_id, limit),
+        ).fetchall()
+        return [dict(r) for r in rows]
+
+
+def count_codes_since(prefix: str, since_ts: int) -> Dict[str, int]:
+    """Numero di eventi per code (code che inizia con prefix) con ts >= since_ts."""
+    init_db()
+    # range [prefix, prefix+1) invece di LIKE: SQLite usa idx_events_code_ts
+    hi = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    with connect() as conn:
+        rows = conn.execute(
+            """
+            SELECT code, COUNT(*) AS n
+            FROM events
+            WHERE code >= ? AND code < ? AND ts >= ?
+            GROUP BY code
+            """,
+            (prefix, hi, since_ts),
+        ).fetchall()
+        return {str(r["code"]): int(r["n"]) for r in rows}
+
+
 def get_event(event_id: int) -> Optional[Dict[str, Any]]:
     init_db()
     with connect() as conn:
@@ -254,7 +311,6 @@ def clear_all_events() -> None:
     """Pulisce events + first_seen (mantiene runtime_flags)."""
     init_db()
     with connect() as conn:
-        conn.execute("PRAGMA busy_timeout=2000;")
         conn.execute("DELETE FROM events;")
         conn.execute("DELETE FROM first_seen;")
         conn.commit()
@@ -296,7 +352,7 @@ def first_seen_touch(key: str) -> bool:
 def list_first_seen(prefix: str, since_ts: int, limit: int = 10):
     """
     Lista le chiavi first_seen che iniziano con prefix e con first_ts >= since_ts.
-    Ritorna dict con key, first_ts, last_ts, count.
+    Ritorna dict con key, first_ts, last_ts, count (timestamp e count già int).
     """
     init_db()
     like = f"{prefix}%"
@@ -314,6 +370,42 @@ def list_first_seen(prefix: str, since_ts: int, limit: int = 10):
         return [dict(r) for r in rows]
 
 
+def list_first_seen_multi(prefixes: List[str], since_ts: int, limit_each: int = 10) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Come list_first_seen ma per più prefissi in un'unica query (UNION ALL di
+    una sottoquery per prefisso, ognuna con il suo LIMIT).
+    Usa range key >= prefix AND key < prefix+1 invece di LIKE, così SQLite può
+    sfruttare la primary key. Ritorna {prefix: [righe]} con lo stesso ordine.
+    """
+    out: Dict[str, List[Dict[str, Any]]] = {p: [] for p in prefixes}
+    if not prefixes:
+        return out
+    init_db()
+    parts: List[str] = []
+    params: List[Any] = []
+    for p in prefixes:
+        parts.append(
+            """
+            SELECT * FROM (
+                SELECT key, first_ts, last_ts, count
+                FROM first_seen
+                WHERE key >= ? AND key < ? AND first_ts >= ?
+                ORDER BY first_ts DESC
+                LIMIT ?
+            )
+            """
+        )
+        params.extend([p, p[:-1] + chr(ord(p[-1]) + 1), since_ts, limit_each])
+    with connect() as conn:
+        rows = conn.execute(" UNION ALL ".join(parts), params).fetchall()
+    for r in rows:
+        for p in prefixes:
+            if r["key"].startswith(p):
+                out[p].append(dict(r))
+                break
+    return out
+
+
 def prune_first_seen(prefix: str, older_than_ts: int) -> int:
     """
     Cancella record first_seen con key che inizia per prefix e first_ts < older_than_ts.
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import json
 import re
 import socket
 import subprocess
@@ -170,7 +171,11 @@ class ListeningPortDetector:
         db.prune_first_seen(prefix="sec04|", older_than_ts=cutoff)
         self._last_prune_ts = now
 
-    def poll(self) -> List[Tuple[str, str, str]]:
+    def poll(self) -> List[Tuple[str, str, str, str]]:
+        """
+        Ritorna lista di (severity, entity, message, details_json).
+        details_json porta i campi strutturati (proc/port/proto/bind), usati dal Trust della TUI.
+        """
         self._prune_if_needed()
 
         snap = self._snapshot()
@@ -183,7 +188,7 @@ class ListeningPortDetector:
             return []
 
         now = _now()
-        events: List[Tuple[str, str, str]] = []
+        events: List[Tuple[str, str, str, str]] = []
 
         # pending cleanup: se è sparito prima dei 60s, lo rimuoviamo
         for k in list(self._pending_since.keys()):
@@ -237,6 +242,7 @@ class ListeningPortDetector:
                 msg = f"Porta esposta: {k.proc} su {host}:{k.port}/{k.proto} (service={svc})."
 
             msg += f" [{k.bind}] [NEW]"
-            events.append((sev, entity, msg))
+            details = {"proc": k.proc, "port": k.port, "proto": k.proto, "bind": k.bind, "host": host, "service": svc}
+            events.append((sev, entity, msg, json.dumps(details, ensure_ascii=False)))
 
         return events
@@ -51,8 +51,8 @@ def _sec04_loop(stop: threading.Event, interval_s: int = 30) -> None:
 
     while not stop.is_set():
         try:
-            for sev, entity, msg in det.poll():
-                db.add_event(code="SEC-04", severity=sev, message=msg, entity=entity)
+            for sev, entity, msg, details_json in det.poll():
+                db.add_event(code="SEC-04", severity=sev, message=msg, entity=entity, details_json=details_json)
                 _maybe_notify("SEC-04", str(sev), str(entity), str(msg))
                 typer.echo(f"[SEC-04] {sev:<8} {entity}  {msg}")
         except Exception as e:
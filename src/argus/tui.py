@@ -1,24 +1,28 @@
 from __future__ import annotations
 
+import heapq
+import json
 import platform
 import re
 import socket
 import subprocess
 import time
+from collections import deque
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Tuple, TypeVar
 
 from rich.console import Group
 from rich.markdown import Markdown
 from rich.panel import Panel
-from rich.text import Text
+from rich.text import Span, Text
 from textual import events
 from textual.app import App, ComposeResult
 from textual.containers import Container, VerticalScroll
 from textual.reactive import reactive
-from textual.widgets import Label, ListItem, ListView, Static
+from textual.widgets import ListItem, ListView, Static
 
 from argus import __version__ as ARGUS_VERSION
 from argus import db, reporter
@@ -41,74 +45,175 @@ CODE_ICON: Dict[str, str] = {
     "SYS": "🛈",
 }
 SEV_ICON = {"INFO": "ℹ️", "WARNING": "⚠️", "CRITICAL": "❗"}
+_SEV_PAD = {s: f"{s:<8}" for s in SEV_ICON}
 
-# SEC-04 message parsing (supports IT/EN, IPv4/IPv6-ish)
+# SEC-04 message parsing (supports IT/EN, IPv4/IPv6-ish); matched against the UTF-8 bytes
 RE_SEC04 = re.compile(
-    r"(?:(?:Nuovo servizio locale|Nuovo servizio in rete|Porta esposta|New local service|New network service|Exposed port)\s*:\s*)?"
-    r"(?P<proc>\S+)\s+(?:su|on)\s+(?P<addr>\S+):(?P<port>\d+)/(?P<proto>\w+).*?\[(?P<bind>LOCAL|LAN|GLOBAL)\]",
-    re.IGNORECASE,
+    rb"(?:(?:Nuovo servizio locale|Nuovo servizio in rete|Porta esposta|New local service|New network service|Exposed port)\s*:\s*)?"
+    rb"(?P<proc>\S+)\s+(?:su|on)\s+(?P<addr>\S+):(?P<port>\d+)/(?P<proto>\w+).*?\[(?P<bind>LOCAL|LAN|GLOBAL)\]",
+    re.IGNORECASE | re.ASCII,
 )
+# every RE_SEC04 match ends with one of these (the leading phrase is optional):
+# a cheap substring test rules out other messages before the regex runs
+_SEC04_BIND_MARKERS = (b"[LOCAL]", b"[LAN]", b"[GLOBAL]")
+
+
+def _sec04_trust_target(e: dict) -> Optional[Tuple[str, int, str]]:
+    """(proc, port, bind) of a SEC-04 event: structured details first, message regex for older rows."""
+    try:
+        d = json.loads(e.get("details_json") or "{}")
+        return str(d["proc"]), int(d["port"]), str(d["bind"]).upper()
+    except Exception:
+        pass
+
+    raw = (e.get("message") or "").encode("utf-8", "replace")
+    up = raw.upper()
+    m = RE_SEC04.search(raw) if any(t in up for t in _SEC04_BIND_MARKERS) else None
+    if not m:
+        return None
+    return m.group("proc").decode("utf-8", "replace"), int(m.group("port")), m.group("bind").decode("ascii").upper()
 
 # ---------------- Helpers ----------------
 
+T = TypeVar("T")
+
+# key -> (monotonic ts, value); for helpers that fork a subprocess
+_CACHE: Dict[str, Tuple[float, object]] = {}
+# keys whose refresh is currently running in a worker thread
+_PENDING: set = set()
+
+
+def _cached_bg(key: str, ttl: float, fn: Callable[[], T], default: T, spawn: Callable[[Callable[[], None]], object]) -> T:
+    """TTL cache that never blocks the caller.
+
+    Returns the last value (or default before the first one) and, when it is stale,
+    hands a job running fn to spawn() so the value is fresh on a later call.
+    """
+    hit = _CACHE.get(key)
+    if (hit is None or time.monotonic() - hit[0] >= ttl) and key not in _PENDING:
+        _PENDING.add(key)
+
+        def job() -> None:
+            try:
+                _CACHE[key] = (time.monotonic(), fn())
+            finally:
+                _PENDING.discard(key)
+
+        spawn(job)
+    return hit[1] if hit is not None else default  # type: ignore[return-value]
+
+
+def _invalidate(key: str) -> None:
+    # mark stale but keep the last value on screen until the refresh lands
+    hit = _CACHE.get(key)
+    if hit is not None:
+        _CACHE[key] = (float("-inf"), hit[1])
+
+
+# (today's midnight, next midnight): recomputed only once the day rolls over
+_MIDNIGHT: Tuple[int, int] = (0, 0)
+
 
 def _midnight_ts() -> int:
-    now = datetime.now()
-    mid = now.replace(hour=0, minute=0, second=0, microsecond=0)
-    return int(mid.timestamp())
+    global _MIDNIGHT
+    if time.time() < _MIDNIGHT[1]:
+        return _MIDNIGHT[0]
+    mid = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+    _MIDNIGHT = (int(mid.timestamp()), int((mid + timedelta(days=1)).timestamp()))
+    return _MIDNIGHT[0]
 
 
-def _global_state(recent: List[dict]) -> str:
-    if any((e.get("severity") or "").upper() == "CRITICAL" for e in recent):
-        return "ALERT"
-    if any((e.get("severity") or "").upper() == "WARNING" for e in recent):
-        return "WATCHING"
-    return "CALM"
+_SEV_WEIGHT = {"CRITICAL": 30, "WARNING": 10}
+_SEV_LEVEL = {"CRITICAL": 2, "WARNING": 1}
+_STATES = ("CALM", "WATCHING", "ALERT")
 
 
-def _score(recent: List[dict], prefix: str) -> int:
-    s = 0
-    for e in recent:
-        code = (e.get("code") or "")
-        if not str(code).startswith(prefix):
+def _normalize(e: dict) -> dict:
+    """Attach _code/_sev/_ts/_msg_short, coerced once when the row is read, for the refresh hot paths."""
+    e["_code"] = e.get("code") or ""
+    e["_sev"] = (e.get("severity") or "INFO").upper()
+    e["_ts"] = int(e.get("ts") or 0)
+    msg = (e.get("message") or "").strip()
+    e["_msg_short"] = msg if len(msg) <= 100 else (msg[:97] + "...")
+    return e
+
+
+def _summarize(events: List[dict], since_ts: int) -> Tuple[str, int, int]:
+    """(state, threat, health) for non-SYS events newer than since_ts, in a single pass (normalized events)."""
+    level = 0
+    threat = 0
+    health = 0
+    for e in events:
+        code = e["_code"]
+        if code == "SYS" or e["_ts"] < since_ts:
             continue
-        sev = (e.get("severity") or "").upper()
-        if sev == "CRITICAL":
-            s += 30
-        elif sev == "WARNING":
-            s += 10
-    return max(0, min(100, s))
+        sev = e["_sev"]
+        level = max(level, _SEV_LEVEL.get(sev, 0))
+        w = _SEV_WEIGHT.get(sev, 0)
+        if code.startswith("SEC-"):
+            threat += w
+        elif code.startswith("HEA-"):
+            health += w
+    return _STATES[level], min(100, threat), min(100, health)
+
+
+def _root_disk_pct() -> str:
+    try:
+        from argus.collectors.disk import root_used_pct  # type: ignore
+
+        pct = root_used_pct()
+        return f"{pct}%" if pct is not None else "--%"
+    except Exception:
+        return "--%"
 
 
 def _status_runstop() -> str:
+    # same first line as `argus status`, computed in-process
     try:
-        r = subprocess.run(["argus", "status"], capture_output=True, text=True, timeout=1.5)
-        out = (r.stdout or "").strip().splitlines()
-        if out:
-            return out[0].strip()
+        from argus.cli import run_state
+
+        return f"STATE: {run_state()}"
     except Exception:
-        pass
-    return "UNKNOWN"
+        return "UNKNOWN"
 
 
 def _flag_badge(flag_name: str) -> str:
     return flag_name.upper() if db.get_flag(flag_name) else ""
 
 
-def _fmt_event_line(e: dict) -> str:
-    ts = datetime.fromtimestamp(int(e["ts"])).strftime("%H:%M:%S")
-    sev = (e.get("severity") or "INFO").upper()
-    code = (e.get("code") or "")
-    msg = (e.get("message") or "").strip()
+@lru_cache(maxsize=4096)
+def _fmt_hms(ts: int) -> str:
+    t = time.localtime(ts)
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+@lru_cache(maxsize=256)
+def _fmt_ymd_hms(ts: int) -> str:
+    t = time.localtime(ts)
+    return f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
+@lru_cache(maxsize=2048)
+def _fmt_event_line_cached(eid: int, ts: int, sev: str, code: str, msg_short: str) -> str:
     icon = CODE_ICON.get(code, "•")
     sev_i = SEV_ICON.get(sev, "•")
-    msg_short = msg if len(msg) <= 100 else (msg[:97] + "...")
-    return f"{ts}  {sev_i} {sev:<8} {icon} {code}  {msg_short}"
+    sev_p = _SEV_PAD.get(sev) or f"{sev:<8}"
+    return f"{_fmt_hms(ts)}  {sev_i} {sev_p} {icon} {code}  {msg_short}"
+
+
+def _fmt_event_line(e: dict) -> str:
+    # rows are immutable once stored: keep the line on the event dict itself
+    line = e.get("_line")
+    if line is None:
+        if "_msg_short" not in e:
+            _normalize(e)
+        line = e["_line"] = _fmt_event_line_cached(
+            int(e.get("id") or 0), e["_ts"], e["_sev"], e["_code"], e["_msg_short"]
+        )
+    return line
 
 
-def _fmt_header(state: str, threat: int, health: int, temp: str, disk: str, run: str) -> str:
-    mute = _flag_badge("mute")
-    maint = _flag_badge("maintenance")
+def _fmt_header(state: str, threat: int, health: int, temp: str, disk: str, run: str, mute: str, maint: str) -> str:
     mm = []
     if mute:
         mm.append("MUTE")
@@ -121,11 +226,29 @@ def _fmt_header(state: str, threat: int, health: int, temp: str, disk: str, run:
     )
 
 
-def _parse_sec03_key(key: str) -> tuple[str, str]:
-    parts = key.split("|")
-    user = parts[1] if len(parts) > 1 else "?"
-    cmd = "|".join(parts[2:]) if len(parts) > 2 else "?"
-    return user, cmd
+# first-seen keys: "sec03|user|cmd..." and "sec04|proc|port|proto|bind" (missing fields -> "?")
+_SEC03_KEY_RE = re.compile(r"[^|]*(?:\|([^|]*))?(?:\|(.*))?", re.DOTALL)
+_SEC04_KEY_RE = re.compile(r"[^|]*(?:\|([^|]*))?(?:\|([^|]*))?(?:\|([^|]*))?(?:\|([^|]*))?")
+
+
+_SEC_CODES = ("SEC-01", "SEC-02", "SEC-03", "SEC-04", "SEC-05")
+_SEC_PREFIX = tuple(f"  {CODE_ICON.get(c, '•')} {c}  x" for c in _SEC_CODES)
+_SEC03_FMT = "  {t}  🧨  {user}  {cmd_s}  (x{cnt})"
+_SEC04_FMT = "  {t}  👂🌐  {proc}  {proto}/{port}  [{bind}] (x{cnt})"
+
+
+# first-seen keys never change once written: parse each one once into its display fields
+@lru_cache(maxsize=512)
+def _sec03_fields(key: str) -> Tuple[str, str]:
+    """(user, cmd_s) for a sec03 key, cmd_s truncated for the summary."""
+    user, cmd = _SEC03_KEY_RE.match(key).groups("?")  # type: ignore[union-attr]
+    return user, ((cmd[:67] + "...") if len(cmd) > 70 else cmd)
+
+
+@lru_cache(maxsize=512)
+def _sec04_fields(key: str) -> Tuple[str, str, str, str]:
+    """(proc, port, proto, bind) for a sec04 key."""
+    return _SEC04_KEY_RE.match(key).groups("?")  # type: ignore[union-attr,return-value]
 
 
 def _read_uptime_seconds() -> Optional[int]:
@@ -137,6 +260,7 @@ def _read_uptime_seconds() -> Optional[int]:
         return None
 
 
+@lru_cache(maxsize=8)  # consecutive banner refreshes often land in the same second
 def _fmt_uptime(sec: Optional[int]) -> str:
     if sec is None:
         return "--"
@@ -148,7 +272,65 @@ def _fmt_uptime(sec: Optional[int]) -> str:
     return f"{h:02d}:{m:02d}:{s:02d}"
 
 
+def _udp_probe_ip() -> Optional[str]:
+    # no packet is sent: connect() on a UDP socket only picks the outgoing route
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            s.connect(("1.1.1.1", 80))
+            return s.getsockname()[0]
+    except Exception:
+        return None
+
+
+# "2: eth0    inet 192.168.1.10/24 brd ..." (ip -o -4 addr)
+_RE_IP_INET = re.compile(r"\binet\s+([^\s/]+)")
+
+_SIOCGIFADDR = 0x8915
+
+
+def _is_lan(ip: str) -> bool:
+    if ip.startswith(("10.", "192.168.", "169.254.")):
+        return True
+    # only 172.16.0.0/12 is private, not all of 172/8
+    if ip.startswith("172."):
+        b2 = ip.split(".", 2)[1]
+        return b2.isdigit() and 16 <= int(b2) <= 31
+    return False
+
+
+def _pick_lan(ips: List[str]) -> Optional[str]:
+    for ip in ips:
+        if _is_lan(ip):
+            return ip
+    return ips[0] if ips else None
+
+
+def _ifaddr_ips() -> List[str]:
+    # IPv4 of every interface via ioctl(SIOCGIFADDR), without forking `ip`
+    try:
+        import fcntl
+        import struct
+
+        ips: List[str] = []
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+            for _idx, name in socket.if_nameindex():
+                try:
+                    res = fcntl.ioctl(s.fileno(), _SIOCGIFADDR, struct.pack("256s", name[:15].encode()))
+                except OSError:
+                    continue  # interface without an IPv4 address
+                ip = socket.inet_ntoa(res[20:24])  # sockaddr_in.sin_addr inside struct ifreq
+                if not ip.startswith("127."):
+                    ips.append(ip)
+        return ips
+    except Exception:
+        return []
+
+
 def _get_lan_ip() -> str:
+    ip = _udp_probe_ip() or _pick_lan(_ifaddr_ips())
+    if ip:
+        return ip
+
     try:
         r = subprocess.run(
             ["ip", "-o", "-4", "addr", "show", "scope", "global"],
@@ -156,31 +338,15 @@ def _get_lan_ip() -> str:
             text=True,
             timeout=1.0,
         )
-        out = (r.stdout or "").strip().splitlines()
-        ips: List[str] = []
-        for line in out:
-            parts = line.split()
-            if "inet" in parts:
-                i = parts.index("inet")
-                ip = parts[i + 1].split("/")[0]
-                ips.append(ip)
-
-        def is_lan(ip: str) -> bool:
-            return ip.startswith("10.") or ip.startswith("192.168.") or ip.startswith("172.") or ip.startswith("169.254.")
-
-        for ip in ips:
-            if is_lan(ip):
-                return ip
-        return ips[0] if ips else "--"
+        return _pick_lan(_RE_IP_INET.findall(r.stdout or "")) or "--"
     except Exception:
-        try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("1.1.1.1", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except Exception:
-            return "--"
+        return "--"
+
+
+@lru_cache(maxsize=1)
+def _host_kernel() -> Tuple[str, str]:
+    # fixed for the lifetime of the process
+    return socket.gethostname(), platform.release()
 
 
 def _logo_argus_lines() -> List[str]:
@@ -236,6 +402,15 @@ def _logo_argus_lines() -> List[str]:
     return out
 
 
+_LOGO_LINES = _logo_argus_lines()
+_LOGO_H = len(_LOGO_LINES)
+_LOGO_W = len(_LOGO_LINES[0]) if _LOGO_LINES else 0
+# non-space logo cells as (x, y, char), relative to the logo's top-left corner
+_LOGO_MASK_XY = tuple(
+    (x, y, row[x]) for y, row in enumerate(_LOGO_LINES) for x in range(len(row)) if row[x] != " "
+)
+
+
 def _splash_body_lines() -> List[str]:
     return [
         "",
@@ -252,15 +427,112 @@ def _splash_body_lines() -> List[str]:
     ]
 
 
-@dataclass
+@dataclass(slots=True)
 class Selected:
     event: dict
 
 
+# ---------------- Footer key legend (static per width tier) ----------------
+
+_KEY_BG = "#30363d"
+_KEY_FG = "#e6edf3"
+_OK_BG = "#1f6feb"
+_DANGER_BG = "#8b2f2f"
+
+
+def _cap(key: str, bg: str = _KEY_BG) -> str:
+    return f"[bold {_KEY_FG} on {bg}] {key} [/bold {_KEY_FG} on {bg}]"
+
+
+def _footer_keys(*keys: Tuple[str, str, str]) -> str:
+    return "  ".join(f"{_cap(k, bg)}[dim] {label}[/dim]" for k, label, bg in keys)
+
+
+_FOOTER_KEYS_WIDE = _footer_keys(
+    ("S", "Start", _OK_BG),
+    ("X", "Stop", _DANGER_BG),
+    ("D", "Details", _KEY_BG),
+    ("V", "View", _KEY_BG),
+    ("H", "Mode", _KEY_BG),
+    ("T", "Trust", _KEY_BG),
+    ("K", "Clear", _KEY_BG),
+    ("M", "Maint", _KEY_BG),
+    ("U", "Mute", _KEY_BG),
+    ("Enter", "Report", _OK_BG),
+    ("Esc", "Back", _KEY_BG),
+    ("Q", "Quit", _DANGER_BG),
+)
+_FOOTER_KEYS_MID = _footer_keys(
+    ("S", "Start", _OK_BG),
+    ("X", "Stop", _DANGER_BG),
+    ("V", "View", _KEY_BG),
+    ("H", "Mode", _KEY_BG),
+    ("D", "Details", _KEY_BG),
+    ("Enter", "Report", _OK_BG),
+    ("Q", "Quit", _DANGER_BG),
+)
+_FOOTER_KEYS_NARROW = _footer_keys(
+    ("S", "Start", _OK_BG),
+    ("X", "Stop", _DANGER_BG),
+    ("Enter", "Report", _OK_BG),
+    ("Q", "Quit", _DANGER_BG),
+)
+
+_FOOTER_STATUS_FMT = "  [dim]|[/dim] ".join(
+    (
+        "[bold]STATE[/bold] [{col}]{state}[/{col}]",
+        "[bold]VIEW[/bold] {view}",
+        "[bold]DETAILS[/bold] {det}",
+        "[bold]MODE[/bold] {mode}",
+        "[bold]FLAGS[/bold] {flags}",
+    )
+)
+
+
+@lru_cache(maxsize=128)
+def _build_footer(width_tier: int, state: str, view: str, det: str, mode: str, mute: bool, maint: bool) -> str:
+    # few distinct combinations: most ticks are a cache hit
+    up = state.upper()
+    if "RUN" in up:
+        state_col = "#3fb950"
+    elif "STOP" in up:
+        state_col = "#f85149"
+    else:
+        state_col = "#d29922"
+
+    flags = []
+    if mute:
+        flags.append("[#d29922]MUTE[/#d29922]")
+    if maint:
+        flags.append("[#58a6ff]MAINT[/#58a6ff]")
+    flags_txt = " ".join(flags) if flags else "[dim]none[/dim]"
+
+    line1 = (_FOOTER_KEYS_NARROW, _FOOTER_KEYS_MID, _FOOTER_KEYS_WIDE)[width_tier]
+    line2 = _FOOTER_STATUS_FMT.format_map(
+        {"col": state_col, "state": state, "view": view, "det": det, "mode": mode, "flags": flags_txt}
+    )
+    return line1 + "\n" + line2
+
+
+_LAYOUT_CLASSES = frozenset(("wide", "stack", "tiny", "short"))
+
+
 class EventRow(ListItem):
+    """Feed row that renders its event line itself (no child Label widget)."""
+
+    DEFAULT_CSS = """
+    EventRow { text-wrap: nowrap; text-overflow: clip; }
+    """
+
+    __slots__ = ("event", "_text")
+
     def __init__(self, e: dict) -> None:
-        super().__init__(Label(_fmt_event_line(e)))
+        super().__init__()
         self.event = e
+        self._text = Text(_fmt_event_line(e))
+
+    def render(self) -> Text:
+        return self._text
 
 
 class ArgusApp(App):
@@ -320,12 +592,40 @@ class ArgusApp(App):
 
     _selected: Optional[Selected] = None
     _last_feed_sig: Tuple[int, int] = (-1, -1)  # (top_id, count)
+    _last_refresh_sig: Optional[tuple] = None
+    _last_hdr_sig: Optional[tuple] = None
+    _last_overlay_sig: Optional[tuple] = None
+    _last_summary_sig: Optional[tuple] = None
+    _counts_key: Optional[Tuple[int, int]] = None
+    _counts_today: Dict[str, int] = {}
+    _window_key: Optional[Tuple[int, int, int]] = None  # (top_id, count, in_window)
+    _visible: List[dict] = []
+    _last_10m: List[dict] = []
+    _window_expiry: int = 0  # when the oldest event in _last_10m leaves the window
+    _window_summary: Tuple[str, int, int] = ("CALM", 0, 0)
+    _first_seen_key: Optional[Tuple[int, int, int]] = None
+    _first_seen: Dict[str, List[dict]] = {}
+    _sys_key: int = -1
+    _sys_vals: Tuple[str, str] = ("--", "--%")
+    _flags: Dict[str, str] = {"mute": "", "maintenance": ""}
+    _last_visibility_sig: Optional[tuple] = None
+    _last_detail_sig: Optional[tuple] = None
+    _last_footer_sig: Optional[tuple] = None
+    _feed_rows: List[EventRow] = []
+
+    # newest-first window of DB events, filled incrementally by id
+    _events: Deque[dict]
+    _max_id: int = 0
 
     _detail_override_text: Optional[str] = None
     _detail_override_event_id: Optional[int] = None
 
-    _last_banner_text: str = ""
+    _banner_ip: Optional[str] = None
+    _banner_parts: Tuple[str, str] = ("", "")
+    _last_text: Dict[str, str] = {}  # widget id -> markup last passed to update()
     _last_banner_update_ts: float = 0.0
+    _last_body_sig: Optional[Tuple[int, bool]] = None
+    _last_size: Tuple[int, int] = (-1, -1)
 
     BINDINGS = [
         ("s", "start_monitor", "Start"),
@@ -363,42 +663,79 @@ class ArgusApp(App):
             yield Static("", id="footerbar")
 
     def on_mount(self) -> None:
-        db.init_db()
+        # schema setup runs in a thread while the splash paints; action_continue waits for it
+        self._db_ready = self.run_worker(db.init_db, thread=True, group="db")
+        self._events = deque(maxlen=500)
+        self._last_text = {}
+        self._row_cache: Dict[tuple, str] = {}  # (key, first_ts, count) -> summary line
+        # widgets are composed once and never replaced: look them up a single time
+        self._w_hdr = self.query_one("#hdr", Static)
+        self._w_overlay = self.query_one("#overlay", Static)
+        self._w_summary = self.query_one("#summary", Static)
+        self._w_feed = self.query_one("#feed", ListView)
+        self._w_summary_box = self.query_one("#summary_box", VerticalScroll)
+        self._w_detail_box = self.query_one("#detail_box", VerticalScroll)
+        self._w_detail_text = self.query_one("#detail_text", Static)
+        self._w_footer = self.query_one("#footerbar", Static)
+        self._w_splash_banner = self.query_one("#splash_banner", Static)
+        self._w_splash_matrix = self.query_one("#splash_matrix", Static)
+        self._w_splash_body = self.query_one("#splash_body", Static)
+        self._w_splash = self.query_one("#splash", Container)
+        self._w_app = self.query_one("#app", Container)
         self._apply_global_visibility()
         self._render_splash(force_banner=True)
 
         # force scrollbar visible on summary + details
         try:
-            self.query_one("#summary_box", VerticalScroll).show_vertical_scrollbar = True
+            self._w_summary_box.show_vertical_scrollbar = True
         except Exception:
             pass
         try:
-            self.query_one("#detail_box", VerticalScroll).show_vertical_scrollbar = True
+            self._w_detail_box.show_vertical_scrollbar = True
         except Exception:
             pass
 
-        self.set_interval(0.06, self._tick_splash)  # splash animation
+        # warm the subprocess-backed values while the splash plays
+        self._run_state()
+        self._lan_ip()
+
+        self._splash_timer = self.set_interval(0.06, self._tick_splash)  # splash animation
+        self._splash_idle_timer = self.set_interval(1.0, self._tick_splash_idle, pause=True)
         self.set_interval(1.0, self._refresh)       # main refresh
+        self._last_size = (self.size.width, self.size.height)
         self._apply_responsive()
 
+    # ---------------- Subprocess-backed values (refreshed off the UI thread) ----------------
+
+    def _spawn(self, job: Callable[[], None]) -> None:
+        self.run_worker(job, thread=True, group="cache")
+
+    def _run_state(self) -> str:
+        return _cached_bg("run", 5.0, _status_runstop, "UNKNOWN", self._spawn)
+
+    def _lan_ip(self) -> str:
+        return _cached_bg("lan", 30.0, _get_lan_ip, "--", self._spawn)
+
     # ---------------- Responsive layout ----------------
 
-    def _apply_responsive(self) -> None:
-        w, h = self.size.width, self.size.height
+    def _apply_responsive(self, size: Optional[Tuple[int, int]] = None) -> None:
+        w, h = size or (self.size.width, self.size.height)
 
         tiny = (w < 92) or (h < 24)
         stack = (not tiny) and (w < 120)
         short = h < 32
 
-        scr = self.screen
-        for cls in ("wide", "stack", "tiny", "short"):
-            scr.remove_class(cls)
-        scr.add_class("tiny" if tiny else ("stack" if stack else "wide"))
-        if short:
-            scr.add_class("short")
-
         self._layout_profile = "tiny" if tiny else ("stack" if stack else "wide")
 
+        # swap the layout classes in one go: a single style update, none if nothing changed
+        scr = self.screen
+        want = {self._layout_profile, "short"} if short else {self._layout_profile}
+        have = _LAYOUT_CLASSES.intersection(scr.classes)
+        if want != have:
+            scr.remove_class(*(have - want), update=False)
+            scr.add_class(*(want - have), update=False)
+            scr.update_node_styles()
+
         # preserve user prefs across resize
         if not hasattr(self, "_user_view_mode"):
             self._user_view_mode = self.view_mode
@@ -422,16 +759,21 @@ class ArgusApp(App):
             self._update_footerbar()
 
     def on_resize(self, event) -> None:  # textual event type varies by version
-        self._apply_responsive()
+        # some terminals repeat resize events without a size change
+        size = (event.size.width, event.size.height)
+        if size == self._last_size:
+            return
+        self._last_size = size
+        self._apply_responsive(size)
 
     # -------- Key handling --------
 
-    def on_key(self, event: events.Key) -> None:
+    async def on_key(self, event: events.Key) -> None:
         k = (event.key or "").lower()
 
         if k in ("enter", "return"):
             if self.ui_mode == "splash":
-                self.action_continue()
+                await self.action_continue()
                 event.stop()
                 return
             self.action_open_selected()
@@ -445,16 +787,21 @@ class ArgusApp(App):
 
     # ---------------- Splash ----------------
 
-    def action_continue(self) -> None:
+    async def action_continue(self) -> None:
+        if self.ui_mode != "splash":
+            return
+        await self._db_ready.wait()
         self.ui_mode = "main"
+        self._splash_timer.stop()
+        self._splash_idle_timer.stop()
         self._apply_global_visibility()
         self._apply_responsive()
         self._refresh()
-        self.query_one("#feed", ListView).focus()
+        self._w_feed.focus()
 
     def _apply_global_visibility(self) -> None:
-        splash = self.query_one("#splash", Container)
-        app = self.query_one("#app", Container)
+        splash = self._w_splash
+        app = self._w_app
 
         if self.ui_mode == "splash":
             splash.remove_class("hidden")
@@ -466,15 +813,19 @@ class ArgusApp(App):
         self._apply_visibility()
 
     def _splash_banner_text(self) -> str:
-        host = socket.gethostname()
-        kernel = platform.release()
-        up = _fmt_uptime(_read_uptime_seconds())
-        ip = _get_lan_ip()
-
-        line0 = "[bold green]ARGUS[/bold green]  [dim]— Argus watches. You decide.[/dim]"
-        line1 = "[bold cyan]OPERATOR[/bold cyan]  [bold]Antonio Ruocco[/bold]"
-        line2 = f"[dim]root@{host} | v{ARGUS_VERSION} | kernel {kernel} | uptime {up} | ip {ip}[/dim]"
-        return "\n".join((line0, line1, line2))
+        # only uptime moves per tick: the text around it is rebuilt when the IP changes
+        ip = self._lan_ip()
+        if ip != self._banner_ip:
+            host, kernel = _host_kernel()
+            line0 = "[bold green]ARGUS[/bold green]  [dim]— Argus watches. You decide.[/dim]"
+            line1 = "[bold cyan]OPERATOR[/bold cyan]  [bold]Antonio Ruocco[/bold]"
+            self._banner_ip = ip
+            self._banner_parts = (
+                f"{line0}\n{line1}\n[dim]root@{host} | v{ARGUS_VERSION} | kernel {kernel} | uptime ",
+                f" | ip {ip}[/dim]",
+            )
+        head, tail = self._banner_parts
+        return head + _fmt_uptime(_read_uptime_seconds()) + tail
 
     # ---------------- Digit-cascade (ARGUS made of 0/1 encoding "I watch U") ----------------
 
@@ -488,23 +839,19 @@ class ArgusApp(App):
         self._dm_w = w
         self._dm_h = h
         self._dm_done = False
+        self._dm_dirty = True  # a frame is pending for the matrix widget
+        self._dm_final_text: Optional[Text] = None
 
-        logo = _logo_argus_lines()
-        lh = len(logo)
-        lw = len(logo[0]) if logo else 0
-
-        x0 = max(0, (w - lw) // 2)
-        y0 = max(0, (h - lh) // 2)
+        x0 = max(0, (w - _LOGO_W) // 2)
+        y0 = max(0, (h - _LOGO_H) // 2)
 
         targets: List[Tuple[int, int]] = []
         targets_by_col: Dict[int, List[int]] = {}
 
-        for y in range(lh):
-            for x in range(lw):
-                if logo[y][x] != " ":
-                    tx, ty = x0 + x, y0 + y
-                    targets.append((tx, ty))
-                    targets_by_col.setdefault(tx, []).append(ty)
+        for x, y, _ch in _LOGO_MASK_XY:
+            tx, ty = x0 + x, y0 + y
+            targets.append((tx, ty))
+            targets_by_col.setdefault(tx, []).append(ty)
 
         for x in targets_by_col:
             targets_by_col[x] = sorted(targets_by_col[x])  # top->bottom
@@ -512,72 +859,97 @@ class ArgusApp(App):
         self._dm_targets = set(targets)
         self._dm_targets_by_col = targets_by_col
 
-        self._dm_filled = {}   # (x,y) -> digit
-        self._dm_falling = {}  # x -> (y, digit, target_y)
+        # offsets in the rendered "\n"-joined text (w chars + newline per row)
+        text_len = h * (w + 1) - 1
+        self._dm_target_spans = [
+            Span(idx, idx + 1, "bold green")
+            for idx in (y * (w + 1) + x for (x, y) in self._dm_targets)
+            if 0 <= idx < text_len
+        ]
+
+        self._dm_blank = b" " * (w * h)
+        self._dm_landed = bytearray(self._dm_blank)  # grid with only the landed digits
+        self._dm_filled_n = 0
+        self._dm_fall_y = [-1] * w  # x -> row of the falling digit, -1 while idle
+        self._dm_next = {x: 0 for x in targets_by_col}  # x -> index of next unfilled target
+        self._dm_active = list(targets_by_col)  # columns with targets still to fill
 
         msg = "I watch U"
         bits = "".join(f"{b:08b}" for b in msg.encode("ascii"))
         ordered = sorted(targets, key=lambda t: (t[1], t[0]))
-        self._dm_target_digit = {pos: bits[i % len(bits)] for i, pos in enumerate(ordered)}
+        # digit byte of each target cell, flat and row-major like the render grid
+        digits = bytearray(w * h)
+        for i, (tx, ty) in enumerate(ordered):
+            if 0 <= tx < w and 0 <= ty < h:
+                digits[ty * w + tx] = ord(bits[i % len(bits)])
+        self._dm_digit_buf = digits
 
     def _dm_step(self) -> None:
         self._dm_ensure()
         if self._dm_done:
             return
-
-        for x, ys in self._dm_targets_by_col.items():
-            if x in self._dm_falling:
-                continue
-
-            next_ty = None
-            for ty in ys:
-                if (x, ty) not in self._dm_filled:
-                    next_ty = ty
-                    break
-            if next_ty is None:
-                continue
-
-            d = self._dm_target_digit.get((x, next_ty), "0")
-            self._dm_falling[x] = (-1, d, next_ty)
-
-        new_falling = {}
-        for x, (y, d, ty) in self._dm_falling.items():
-            y2 = y + 1
-            if y2 >= ty:
-                self._dm_filled[(x, ty)] = d
+        self._dm_dirty = True
+
+        fall_y = self._dm_fall_y
+        landed = self._dm_landed
+        nxt = self._dm_next
+        by_col = self._dm_targets_by_col
+        digits = self._dm_digit_buf
+        w = self._dm_w
+        filled_n = self._dm_filled_n
+
+        # one pass per column: an idle column spawns at y=-1, then every digit moves down
+        # one row and locks into the landed grid on reaching its target
+        active = []
+        for x in self._dm_active:
+            ys = by_col[x]
+            ty = ys[nxt[x]]
+            y = fall_y[x] + 1
+            if y >= ty:
+                idx = ty * w + x
+                landed[idx] = digits[idx] or 0x30
+                filled_n += 1
+                fall_y[x] = -1
+                nxt[x] += 1
+                if nxt[x] < len(ys):
+                    active.append(x)
             else:
-                new_falling[x] = (y2, d, ty)
-        self._dm_falling = new_falling
+                fall_y[x] = y
+                active.append(x)
+
+        self._dm_active = active
+        self._dm_filled_n = filled_n
 
-        if self._dm_targets and len(self._dm_filled) >= len(self._dm_targets):
+        if self._dm_targets and filled_n >= len(self._dm_targets):
             self._dm_done = True
 
     def _dm_render(self) -> Text:
         self._dm_ensure()
+        if self._dm_final_text is not None:
+            return self._dm_final_text
         w, h = self._dm_w, self._dm_h
 
-        grid = [[" " for _ in range(w)] for _ in range(h)]
-
-        for (x, y), d in self._dm_filled.items():
-            if 0 <= x < w and 0 <= y < h:
-                grid[y][x] = d
+        # row-major grid of ASCII digits/spaces
+        buf = bytearray(self._dm_landed)
 
-        for x, (y, d, _ty) in self._dm_falling.items():
-            if 0 <= x < w and 0 <= y < h and grid[y][x] == " ":
-                grid[y][x] = d
+        fall_y, nxt, by_col, digits = self._dm_fall_y, self._dm_next, self._dm_targets_by_col, self._dm_digit_buf
+        for x in self._dm_active:
+            y = fall_y[x]
+            if 0 <= y < h and buf[y * w + x] == 0x20:
+                buf[y * w + x] = digits[by_col[x][nxt[x]] * w + x] or 0x30
 
-        txt = Text("\n".join("".join(r) for r in grid), style="green")
-
-        for (x, y) in self._dm_targets:
-            idx = y * (w + 1) + x
-            if 0 <= idx < len(txt):
-                txt.stylize("bold green", idx, idx + 1)
+        rows = [buf[y * w:(y + 1) * w].decode("latin-1") for y in range(h)]
+        # target cells are highlighted through the spans built once per resize
+        txt = Text("\n".join(rows), style="green", spans=self._dm_target_spans.copy())
 
+        # the finished logo never changes again (until a resize)
+        if self._dm_done:
+            self._dm_final_text = txt
         return txt
 
     def _splash_ready_line(self) -> str:
         total = len(getattr(self, "_dm_targets", [])) or 1
-        filled = len(getattr(self, "_dm_filled", {})) or 0
+        filled = getattr(self, "_dm_filled_n", 0)
         pct = int(min(100, (filled * 100) / total))
         done = bool(getattr(self, "_dm_done", False)) or pct >= 100
 
@@ -605,26 +977,54 @@ class ArgusApp(App):
         return txt
 
     def _render_splash(self, force_banner: bool = False) -> None:
-        banner = self.query_one("#splash_banner", Static)
-        matrix = self.query_one("#splash_matrix", Static)
-        body = self.query_one("#splash_body", Static)
+        banner = self._w_splash_banner
+        matrix = self._w_splash_matrix
+        body = self._w_splash_body
 
         now = time.time()
         if force_banner or (now - self._last_banner_update_ts) >= 0.5:
-            btxt = self._splash_banner_text()
-            if btxt != self._last_banner_text:
-                banner.update(btxt)
-                self._last_banner_text = btxt
+            self._set_text(banner, self._splash_banner_text())
             self._last_banner_update_ts = now
 
-        matrix.update(self._dm_render())
-        body.update(self._splash_body_render_text())
+        # redraw only after a step (or a resize) moved something
+        self._dm_ensure()
+        if self._dm_dirty:
+            self._dm_dirty = False
+            matrix.update(self._dm_render())
+
+        # body only changes when the READY percentage moves
+        body_sig = (self._dm_filled_n, self._dm_done)
+        if body_sig != self._last_body_sig:
+            self._last_body_sig = body_sig
+            self._set_text(body, self._splash_body_render_text())
+
+    def _set_text(self, widget: Static, txt: str) -> None:
+        # Static.update() re-renders and re-lays out even for identical markup
+        if self._last_text.get(widget.id or "") == txt:
+            return
+        self._last_text[widget.id or ""] = txt
+        widget.update(txt)
 
     def _tick_splash(self) -> None:
         if self.ui_mode != "splash":
             return
         self._dm_step()
         self._render_splash()
+        # the logo has landed: only the banner uptime still moves, 1 Hz is enough
+        if self._dm_done:
+            self._splash_timer.pause()
+            self._splash_idle_timer.resume()
+
+    def _tick_splash_idle(self) -> None:
+        if self.ui_mode != "splash":
+            return
+        self._dm_ensure()
+        if not self._dm_done:
+            # a resize restarted the cascade: back to the animation rate
+            self._splash_idle_timer.pause()
+            self._splash_timer.resume()
+            return
+        self._render_splash()
 
     # ---------------- Main UI ----------------
 
@@ -653,8 +1053,8 @@ class ArgusApp(App):
         self._update_footerbar()
 
     def _apply_visibility(self) -> None:
-        summary_box = self.query_one("#summary_box", VerticalScroll)
-        detail_box = self.query_one("#detail_box", VerticalScroll)
+        summary_box = self._w_summary_box
+        detail_box = self._w_detail_box
 
         if self.view_mode == "minimal":
             summary_box.add_class("hidden")
@@ -676,25 +1076,31 @@ class ArgusApp(App):
         self._detail_override_event_id = None
         self._update_detail()
 
+    def _monitor_cmd(self, verb: str) -> None:
+        # systemctl can take seconds: run `argus start/stop` off the UI thread
+        label = verb.capitalize()
+
+        def job() -> None:
+            try:
+                subprocess.run(["argus", verb], timeout=2)
+                _invalidate("run")
+                db.add_event(code="SYS", severity="INFO", message=f"{label} requested from TUI.", entity="tui")
+            except Exception as e:
+                db.add_event(code="SYS", severity="WARNING", message=f"{label} error ({e!r})", entity="tui")
+            self.call_from_thread(self._refresh)
+
+        self.run_worker(job, thread=True, group="monitor")
+
     def action_start_monitor(self) -> None:
-        try:
-            subprocess.run(["argus", "start"], timeout=2)
-            db.add_event(code="SYS", severity="INFO", message="Start requested from TUI.", entity="tui")
-        except Exception as e:
-            db.add_event(code="SYS", severity="WARNING", message=f"Start error ({e!r})", entity="tui")
-        self._refresh()
+        self._monitor_cmd("start")
 
     def action_stop_monitor(self) -> None:
-        try:
-            subprocess.run(["argus", "stop"], timeout=2)
-            db.add_event(code="SYS", severity="INFO", message="Stop requested from TUI.", entity="tui")
-        except Exception as e:
-            db.add_event(code="SYS", severity="WARNING", message=f"Stop error ({e!r})", entity="tui")
-        self._refresh()
+        self._monitor_cmd("stop")
 
     def action_maintenance_30(self) -> None:
         try:
-            subprocess.run(["argus", "maintenance", "30m"], timeout=2)
+            db.set_flag("maintenance", "1", ttl_seconds=30 * 60)
+            self._sys_key = -1
             db.add_event(code="SYS", severity="INFO", message="Maintenance 30m enabled from TUI.", entity="tui")
         except Exception as e:
             db.add_event(code="SYS", severity="WARNING", message=f"Maintenance error ({e!r})", entity="tui")
@@ -702,7 +1108,8 @@ class ArgusApp(App):
 
     def action_mute_10(self) -> None:
         try:
-            subprocess.run(["argus", "mute", "10m"], timeout=2)
+            db.set_flag("mute", "1", ttl_seconds=10 * 60)
+            self._sys_key = -1
             db.add_event(code="SYS", severity="INFO", message="Mute 10m enabled from TUI.", entity="tui")
         except Exception as e:
             db.add_event(code="SYS", severity="WARNING", message=f"Mute error ({e!r})", entity="tui")
@@ -712,17 +1119,26 @@ class ArgusApp(App):
         if self.ui_mode != "main":
             return
 
-        lv = self.query_one("#feed", ListView)
-        overlay = self.query_one("#overlay", Static)
-        summary = self.query_one("#summary", Static)
-        detail_text = self.query_one("#detail_text", Static)
+        lv = self._w_feed
+        overlay = self._w_overlay
+        summary = self._w_summary
+        detail_text = self._w_detail_text
 
         lv.clear()
-        overlay.update("")
-        summary.update("")
+        self._feed_rows = []
+        self._set_text(overlay, "")
+        self._set_text(summary, "")
         detail_text.update("")
         self._selected = None
         self._last_feed_sig = (-1, -1)
+        self._last_refresh_sig = None
+        self._last_overlay_sig = None
+        self._last_summary_sig = None
+        self._counts_key = None
+        self._window_key = None
+        self._window_expiry = 0
+        self._first_seen_key = None
+        self._events.clear()
 
         self._detail_override_text = None
         self._detail_override_event_id = None
@@ -740,7 +1156,7 @@ class ArgusApp(App):
     def action_cursor_up(self) -> None:
         if self.ui_mode != "main":
             return
-        lv = self.query_one("#feed", ListView)
+        lv = self._w_feed
         if not lv.children:
             lv.index = None
             return
@@ -752,7 +1168,7 @@ class ArgusApp(App):
     def action_cursor_down(self) -> None:
         if self.ui_mode != "main":
             return
-        lv = self.query_one("#feed", ListView)
+        lv = self._w_feed
         if not lv.children:
             lv.index = None
             return
@@ -769,6 +1185,7 @@ class ArgusApp(App):
 
         e = self._selected.event
         eid = int(e.get("id") or 0)
+        self._sync_report_path(e)
         md_path = (e.get("report_md_path") or "").strip()
         if not md_path:
             db.add_event(code="SYS", severity="INFO", message="No report associated to this event.", entity="tui")
@@ -788,7 +1205,7 @@ class ArgusApp(App):
 
         self._detail_override_text = txt
         self._detail_override_event_id = eid
-        self.query_one("#detail_text", Static).update(Markdown(txt))
+        self._w_detail_text.update(Markdown(txt))
 
     def action_trust_selected(self) -> None:
         if self.ui_mode != "main":
@@ -801,23 +1218,19 @@ class ArgusApp(App):
 
         e = self._selected.event
         code = (e.get("code") or "")
-        msg = (e.get("message") or "")
 
         if code != "SEC-04":
             db.add_event(code="SYS", severity="INFO", message="Trust: valid only for SEC-04.", entity="tui")
             self._refresh()
             return
 
-        m = RE_SEC04.search(msg)
-        if not m:
+        target = _sec04_trust_target(e)
+        if target is None:
             db.add_event(code="SYS", severity="WARNING", message="Trust: failed to parse proc/port/bind.", entity="tui")
             self._refresh()
             return
 
-        proc = m.group("proc")
-        port = int(m.group("port"))
-        bind = m.group("bind").upper()
-
+        proc, port, bind = target
         _, out = add_sec04_trust(proc, port, bind)
         db.add_event(code="SYS", severity="INFO", message=f"Trust SEC-04: {out}", entity="tui")
         self._refresh()
@@ -832,16 +1245,27 @@ class ArgusApp(App):
                 self._detail_override_text = None
                 self._detail_override_event_id = None
 
+            self._sync_report_path(item.event)
             self._selected = Selected(event=item.event)
             self._update_detail()
 
+    def _sync_report_path(self, e: dict) -> None:
+        # reports are attached right after insert: re-read rows cached before that
+        if (e.get("report_md_path") or "").strip():
+            return
+        if not str(e.get("code") or "").startswith(("SEC-", "HEA-")):
+            return
+        fresh = db.get_event(int(e.get("id") or 0))
+        if fresh:
+            e.update(fresh)
+
     # ---------------- Details “card” ----------------
 
     def _update_detail(self) -> None:
         if self.ui_mode != "main":
             return
 
-        detail = self.query_one("#detail_text", Static)
+        detail = self._w_detail_text
 
         if not self._selected:
             detail.update("")
@@ -855,7 +1279,7 @@ class ArgusApp(App):
             detail.update(Markdown(self._detail_override_text))
             return
 
-        ts = datetime.fromtimestamp(int(e["ts"])).strftime("%Y-%m-%d %H:%M:%S")
+        ts = _fmt_ymd_hms(int(e["ts"]))
         sev = (e.get("severity") or "INFO").upper()
         code = (e.get("code") or "").upper()
         ent = (e.get("entity") or "")
@@ -988,214 +1412,276 @@ class ArgusApp(App):
 
     # ---------------- Footer ----------------
 
-    def _update_footerbar(self) -> None:
+    def _update_footerbar(self, run: Optional[str] = None) -> None:
         if self.ui_mode != "main":
             return
 
-        footer = self.query_one("#footerbar", Static)
-
-        KEY_BG = "#30363d"
-        KEY_FG = "#e6edf3"
-        OK_BG = "#1f6feb"
-        DANGER_BG = "#8b2f2f"
-        DIM = "[dim]|[/dim]"
-
-        def cap(key: str, bg: str = KEY_BG) -> str:
-            return f"[bold {KEY_FG} on {bg}] {key} [/bold {KEY_FG} on {bg}]"
+        footer = self._w_footer
 
-        run_line = _status_runstop()
+        run_line = run if run is not None else self._run_state()
         state = run_line.split(":", 1)[1].strip() if ":" in run_line else run_line.strip()
         state = state or "UNKNOWN"
 
-        if "RUN" in state.upper():
-            state_col = "#3fb950"
-        elif "STOP" in state.upper():
-            state_col = "#f85149"
-        else:
-            state_col = "#d29922"
-
         view = "Dashboard" if self.view_mode == "dashboard" else "Minimal"
         prof = getattr(self, "_layout_profile", "wide")
         det_on = (self.view_mode == "dashboard" and self.show_details and (self.size.width >= 100 or prof == "stack"))
         det = "ON" if det_on else "OFF"
         mode = "Simple" if self.detail_mode == "simple" else "Tech"
 
-        flags = []
-        if _flag_badge("mute"):
-            flags.append("[#d29922]MUTE[/#d29922]")
-        if _flag_badge("maintenance"):
-            flags.append("[#58a6ff]MAINT[/#58a6ff]")
-        flags_txt = " ".join(flags) if flags else "[dim]none[/dim]"
-
         w = self.size.width
+        tier = 2 if w >= 118 else (1 if w >= 92 else 0)
 
-        if w >= 118:
-            line1 = (
-                f"{cap('S', OK_BG)}[dim] Start[/dim]  "
-                f"{cap('X', DANGER_BG)}[dim] Stop[/dim]  "
-                f"{cap('D')}[dim] Details[/dim]  "
-                f"{cap('V')}[dim] View[/dim]  "
-                f"{cap('H')}[dim] Mode[/dim]  "
-                f"{cap('T')}[dim] Trust[/dim]  "
-                f"{cap('K')}[dim] Clear[/dim]  "
-                f"{cap('M')}[dim] Maint[/dim]  "
-                f"{cap('U')}[dim] Mute[/dim]  "
-                f"{cap('Enter', OK_BG)}[dim] Report[/dim]  "
-                f"{cap('Esc')}[dim] Back[/dim]  "
-                f"{cap('Q', DANGER_BG)}[dim] Quit[/dim]"
-            )
-        elif w >= 92:
-            line1 = (
-                f"{cap('S', OK_BG)}[dim] Start[/dim]  "
-                f"{cap('X', DANGER_BG)}[dim] Stop[/dim]  "
-                f"{cap('V')}[dim] View[/dim]  "
-                f"{cap('H')}[dim] Mode[/dim]  "
-                f"{cap('D')}[dim] Details[/dim]  "
-                f"{cap('Enter', OK_BG)}[dim] Report[/dim]  "
-                f"{cap('Q', DANGER_BG)}[dim] Quit[/dim]"
-            )
-        else:
-            line1 = (
-                f"{cap('S', OK_BG)}[dim] Start[/dim]  "
-                f"{cap('X', DANGER_BG)}[dim] Stop[/dim]  "
-                f"{cap('Enter', OK_BG)}[dim] Report[/dim]  "
-                f"{cap('Q', DANGER_BG)}[dim] Quit[/dim]"
-            )
-
-        line2 = (
-            f"[bold]STATE[/bold] [{state_col}]{state}[/{state_col}]  {DIM} "
-            f"[bold]VIEW[/bold] {view}  {DIM} "
-            f"[bold]DETAILS[/bold] {det}  {DIM} "
-            f"[bold]MODE[/bold] {mode}  {DIM} "
-            f"[bold]FLAGS[/bold] {flags_txt}"
+        self._set_text(
+            footer,
+            _build_footer(tier, state, view, det, mode, bool(self._flags["mute"]), bool(self._flags["maintenance"])),
         )
 
-        footer.update(line1 + "\n" + line2)
+    # ---------------- Dashboard rows ----------------
+
+    def _render_sec03_row(self, row: dict) -> str:
+        key, first_ts, cnt = row["key"], row["first_ts"], row["count"]
+        ck = (key, first_ts, cnt)
+        line = self._row_cache.get(ck)
+        if line is None:
+            user, cmd_s = _sec03_fields(key)
+            line = _SEC03_FMT.format_map({"t": _fmt_hms(first_ts), "user": user, "cmd_s": cmd_s, "cnt": cnt})
+            self._row_cache[ck] = line
+        return line
+
+    def _render_sec04_row(self, row: dict) -> str:
+        key, first_ts, cnt = row["key"], row["first_ts"], row["count"]
+        ck = (key, first_ts, cnt)
+        line = self._row_cache.get(ck)
+        if line is None:
+            proc, port, proto, bind = _sec04_fields(key)
+            line = _SEC04_FMT.format_map(
+                {"t": _fmt_hms(first_ts), "proc": proc, "port": port, "proto": proto, "bind": bind, "cnt": cnt}
+            )
+            self._row_cache[ck] = line
+        return line
 
     # ---------------- Refresh loop ----------------
 
+    def _update_feed(self, lv: ListView, rows: List[dict]) -> int:
+        """Patch the feed in place: prepend new events, replace changed positions, trim the tail.
+
+        Returns how many rows were prepended (0 when the feed was diffed by position)."""
+        old_rows = self._feed_rows
+        old_ids = [int(r.event.get("id") or 0) for r in old_rows]
+        new_ids = [int(e.get("id") or 0) for e in rows]
+
+        # common case: a few new events on top, everything else shifted down
+        k = 0
+        if old_ids:
+            while k < len(new_ids) and new_ids[k] > old_ids[0]:
+                k += 1
+        if k and new_ids[k:] == old_ids[: len(new_ids) - k]:
+            fresh = [EventRow(e) for e in rows[:k]]
+            lv.insert(0, fresh)
+            for row in old_rows[len(rows) - k:]:
+                row.remove()
+            self._feed_rows = fresh + old_rows[: len(rows) - k]
+            return k
+
+        # otherwise diff position by position, keeping rows whose event is unchanged
+        kept: List[EventRow] = []
+        for i, e in enumerate(rows):
+            old = old_rows[i] if i < len(old_rows) else None
+            if old is not None and old_ids[i] == new_ids[i]:
+                kept.append(old)
+                continue
+            row = EventRow(e)
+            if old is not None:
+                lv.mount(row, before=old)
+                old.remove()
+            else:
+                lv.mount(row)
+            kept.append(row)
+
+        for old in old_rows[len(rows):]:
+            old.remove()
+        self._feed_rows = kept
+        return 0
+
     def _refresh(self) -> None:
         if self.ui_mode != "main":
             return
 
-        hdr = self.query_one("#hdr", Static)
-        overlay = self.query_one("#overlay", Static)
-        summary = self.query_one("#summary", Static)
-        lv = self.query_one("#feed", ListView)
+        hdr = self._w_hdr
+        overlay = self._w_overlay
+        summary = self._w_summary
+        lv = self._w_feed
 
         now = int(time.time())
         since_10m = now - 600
         midnight = _midnight_ts()
 
-        all_recent = db.list_events(limit=500)
-        visible = [e for e in all_recent if (e.get("code") or "") != "SYS"]
+        new = db.list_events_since(self._max_id, limit=500)
+        if new:
+            self._max_id = int(new[0]["id"])
+            self._events.extendleft(_normalize(e) for e in reversed(new))
+        # rescan only when events arrived or the oldest one in the window aged out
+        if new or now >= self._window_expiry:
+            # one pass: non-SYS events, and those of them inside the 10-minute window
+            visible: List[dict] = []
+            last_10m: List[dict] = []
+            add_e, add_10m = visible.append, last_10m.append
+            oldest = now
+            for e in self._events:
+                if e["_code"] == "SYS":
+                    continue
+                add_e(e)
+                t = e["_ts"]
+                if t >= since_10m:
+                    add_10m(e)
+                    if t < oldest:
+                        oldest = t
+            self._visible, self._last_10m = visible, last_10m
+            self._window_expiry = oldest + 601 if last_10m else now + 600
+        visible, last_10m = self._visible, self._last_10m
 
         top_id = int(visible[0].get("id") or 0) if visible else 0
         feed_sig = (top_id, len(visible))
 
-        last_10m = [e for e in visible if int(e.get("ts", 0)) >= since_10m]
-        state = _global_state(last_10m)
-        threat = _score(last_10m, "SEC-")
-        health = _score(last_10m, "HEA-")
-
-        temp = format_cpu_temp()
-
-        disk = "--%"
-        try:
-            from argus.collectors.disk import root_used_pct  # type: ignore
-
-            pct = root_used_pct()
-            disk = f"{pct}%" if pct is not None else "--%"
-        except Exception:
-            disk = "--%"
-
-        run = _status_runstop()
-        hdr.update(_fmt_header(state, threat, health, temp, disk, run))
-
-        crit_now = [e for e in last_10m if (e.get("severity") or "").upper() == "CRITICAL"]
-        crit_now = sorted(crit_now, key=lambda x: int(x["ts"]), reverse=True)[:3]
-        if crit_now:
-            lines = ["ACTIVE CRITICAL"]
-            for ev in crit_now:
-                lines.append("  " + _fmt_event_line(ev))
-            overlay.update("\n".join(lines))
-        else:
-            overlay.update("")
+        # the 10-minute window only changes when events arrive or age out
+        window_key = (feed_sig[0], feed_sig[1], len(last_10m))
+        if window_key != self._window_key:
+            self._window_key = window_key
+            self._window_summary = _summarize(last_10m, since_10m)
+        state, threat, health = self._window_summary
+
+        # temperature, disk usage and the mute/maintenance flags move slowly: sampled every 5s
+        # (M/U reset _sys_key so their own flag shows up on the next refresh)
+        sys_key = now // 5
+        if sys_key != self._sys_key:
+            self._sys_key = sys_key
+            self._sys_vals = (format_cpu_temp(), _root_disk_pct())
+            self._flags = {"mute": _flag_badge("mute"), "maintenance": _flag_badge("maintenance")}
+        temp, disk = self._sys_vals
+
+        run = self._run_state()
+
+        crit_now = heapq.nlargest(
+            3,
+            (e for e in last_10m if e["_sev"] == "CRITICAL"),
+            key=lambda x: x["_ts"],
+        )
 
+        counts_today: Dict[str, int] = {}
+        sec03_today: List[dict] = []
+        sec04_today: List[dict] = []
         if self.view_mode == "dashboard":
-            counts_today: Dict[str, int] = {}
-            for ev in visible:
-                if int(ev.get("ts", 0)) < midnight:
-                    continue
-                c = (ev.get("code") or "")
-                if str(c).startswith("SEC-"):
-                    counts_today[c] = counts_today.get(c, 0) + 1
-
-            sec03_today = db.list_first_seen(prefix="sec03|", since_ts=midnight, limit=5)
-            sec04_today = db.list_first_seen(prefix="sec04|", since_ts=midnight, limit=5)
-
-            out: List[str] = []
-            out.append("Security (today)")
-            any_sec = False
-            for c in ["SEC-01", "SEC-02", "SEC-03", "SEC-04", "SEC-05"]:
-                if c in counts_today:
-                    any_sec = True
-                    out.append(f"  {CODE_ICON.get(c,'•')} {c}  x{counts_today[c]}")
-            if not any_sec:
-                out.append("  (no SEC events today)")
-
-            out.append("")
-            out.append("SEC-03 — Unusual sudo seen today (first-seen)")
-            if not sec03_today:
-                out.append("  (no new entries today)")
+            # aggregated in SQLite; re-queried only when the day or the newest event changes
+            counts_key = (midnight, self._max_id)
+            if counts_key != self._counts_key:
+                self._counts_key = counts_key
+                self._counts_today = db.count_codes_since("SEC-", midnight)
+            counts_today = self._counts_today
+
+            # repeat sightings bump first_seen.count without emitting an event,
+            # so besides new events re-read at most every 5s
+            first_seen_key = (midnight, self._max_id, now // 5)
+            if first_seen_key != self._first_seen_key:
+                self._first_seen_key = first_seen_key
+                self._first_seen = db.list_first_seen_multi(["sec03|", "sec04|"], since_ts=midnight, limit_each=5)
+            sec03_today = self._first_seen["sec03|"]
+            sec04_today = self._first_seen["sec04|"]
+
+        mute = self._flags["mute"]
+        maint = self._flags["maintenance"]
+        hdr_sig = (state, threat, health, temp, disk, run, mute, maint)
+        overlay_sig = tuple(int(e.get("id") or 0) for e in crit_now)
+        summary_sig = (
+            self.view_mode,
+            tuple(counts_today.items()),
+            tuple((r["key"], r["first_ts"], r["count"]) for r in sec03_today + sec04_today),
+        )
+
+        # nothing on screen would change: skip all widget updates this tick
+        sig = (feed_sig, hdr_sig, overlay_sig, summary_sig)
+        if sig == self._last_refresh_sig:
+            return
+        self._last_refresh_sig = sig
+
+        if hdr_sig != self._last_hdr_sig:
+            self._last_hdr_sig = hdr_sig
+            self._set_text(hdr, _fmt_header(state, threat, health, temp, disk, run, mute, maint))
+
+        if overlay_sig != self._last_overlay_sig:
+            self._last_overlay_sig = overlay_sig
+            if crit_now:
+                lines = ["ACTIVE CRITICAL"]
+                for ev in crit_now:
+                    lines.append("  " + _fmt_event_line(ev))
+                self._set_text(overlay, "\n".join(lines))
             else:
-                for row in sec03_today:
-                    tt = datetime.fromtimestamp(int(row["first_ts"])).strftime("%H:%M:%S")
-                    user, cmd = _parse_sec03_key(row.get("key", ""))
-                    cnt = int(row.get("count", 1))
-                    cmd_s = cmd if len(cmd) <= 70 else cmd[:67] + "..."
-                    out.append(f"  {tt}  🧨  {user}  {cmd_s}  (x{cnt})")
-
-            out.append("")
-            out.append("SEC-04 — New listening services seen today (first-seen)")
-            if not sec04_today:
-                out.append("  (no new entries today)")
+                self._set_text(overlay, "")
+
+        if summary_sig != self._last_summary_sig:
+            self._last_summary_sig = summary_sig
+            if self.view_mode == "dashboard":
+                sec_lines = "\n".join(
+                    p + str(counts_today[c]) for p, c in zip(_SEC_PREFIX, _SEC_CODES) if c in counts_today
+                ) or "  (no SEC events today)"
+                sec03_block = "\n".join(map(self._render_sec03_row, sec03_today)) or "  (no new entries today)"
+                sec04_block = "\n".join(map(self._render_sec04_row, sec04_today)) or "  (no new entries today)"
+
+                # keep only the rows still on screen
+                shown = {(r["key"], r["first_ts"], r["count"]) for r in sec03_today + sec04_today}
+                self._row_cache = {k: v for k, v in self._row_cache.items() if k in shown}
+
+                self._set_text(
+                    summary,
+                    f"Security (today)\n{sec_lines}\n\n"
+                    f"SEC-03 — Unusual sudo seen today (first-seen)\n{sec03_block}\n\n"
+                    f"SEC-04 — New listening services seen today (first-seen)\n{sec04_block}"
+                )
             else:
-                for row in sec04_today:
-                    tt = datetime.fromtimestamp(int(row["first_ts"])).strftime("%H:%M:%S")
-                    key = row.get("key", "")
-                    parts = key.split("|")
-                    proc = parts[1] if len(parts) > 1 else "?"
-                    port = parts[2] if len(parts) > 2 else "?"
-                    proto = parts[3] if len(parts) > 3 else "?"
-                    bind = parts[4] if len(parts) > 4 else "?"
-                    cnt = int(row.get("count", 1))
-                    out.append(f"  {tt}  👂🌐  {proc}  {proto}/{port}  [{bind}] (x{cnt})")
-
-            summary.update("\n".join(out))
-        else:
-            summary.update("")
+                self._set_text(summary, "")
 
         if feed_sig != self._last_feed_sig:
             self._last_feed_sig = feed_sig
             old_index = lv.index
+            shifted = self._update_feed(lv, visible[:20])
 
-            lv.clear()
-            for ev in visible[:20]:
-                lv.append(EventRow(ev))
-
-            if len(lv.children) > 0:
+            n = len(self._feed_rows)
+            if n > 0:
                 if old_index is not None:
-                    lv.index = min(max(0, old_index), len(lv.children) - 1)
+                    # stay on the same event when rows were prepended above it;
+                    # a selection on the top row keeps following the newest event
+                    if old_index > 0:
+                        old_index += shifted
+                    lv.index = min(max(0, old_index), n - 1)
                 else:
                     lv.index = 0
             else:
                 lv.index = None
                 self._selected = None
 
-        self._apply_visibility()
-        self._update_detail()
-        self._update_footerbar()
+        # the tail widgets only depend on these inputs; skip them when none changed
+        prof = getattr(self, "_layout_profile", "wide")
+        wide = self.size.width
+        visibility_sig = (self.view_mode, self.show_details, wide >= 100, prof)
+        if visibility_sig != self._last_visibility_sig:
+            self._last_visibility_sig = visibility_sig
+            self._apply_visibility()
+
+        sel = self._selected.event if self._selected else None
+        detail_sig = (
+            sel.get("id") if sel else None,
+            sel.get("report_md_path") if sel else None,
+            self.detail_mode,
+            self._detail_override_event_id,
+            self._detail_override_text is not None,
+        )
+        if detail_sig != self._last_detail_sig:
+            self._last_detail_sig = detail_sig
+            self._update_detail()
+
+        footer_sig = (run, mute, maint, visibility_sig, self.detail_mode, wide)
+        if footer_sig != self._last_footer_sig:
+            self._last_footer_sig = footer_sig
+            self._update_footerbar(run=run)
 
 
 def run_tui() -> None: